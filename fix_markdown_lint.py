@@ -18,7 +18,11 @@ import sys
 import argparse
 import logging
 import json
-from concurrent.futures import ProcessPoolExecutor
+import functools
+import hashlib
+import mmap
+import shutil
+import tempfile
 from pathlib import Path
 
 
@@ -30,6 +34,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger('markdown_lint_fixer')
 
+# Precompiled patterns shared by the fixers below
+_OL_RE = re.compile(r'^(\s*)(\d+)\.\s(.*)$')
+_UL_RE = re.compile(r'^(\s*)[-*+]\s')
+_LEADING_WS_RE = re.compile(r'^\s*')
+
+# Whole-content probes: find any line the list stages would act on
+_OL_LINE_RE = re.compile(r'^[^\S\n]*\d+\.[^\S\n]', re.MULTILINE)
+_UL_LINE_RE = re.compile(r'^[^\S\n]*[-*+][^\S\n]', re.MULTILINE)
+
+# Every fix that fix_all knows, in the order it applies them
+_ALL_FIXES = ('whitespace', 'code-blocks', 'lists', 'headings',
+              'blank-lines', 'line-length')
+
+# Where --cache records files that a previous run found needed no fixes
+_CACHE_FILE = '.markdownlint-cache'
+
+# Files larger than this are decoded straight from a memory map
+_MMAP_THRESHOLD = 1 << 20
+
+# First-line prefixes that mark a code block as shell commands
+_SHELL_PREFIXES = (
+    'docker ', 'docker-compose', 'npm ', 'node ', 'git ', 'cd ', 'make ',
+    'sudo ', 'curl ', 'wget ')
+
+# Preferred places to break an over-long line, in priority order
+_BREAK_POINTS = ('. ', ', ', ': ', '; ', ' - ', ' and ', ' or ', ' but ')
+
+
+@functools.lru_cache(maxsize=8)
+def _read_markdownlint_config(config_path, mtime):
+    """
+    Read the settings we use from a markdownlint configuration file.
+    
+    Results are cached; mtime is part of the cache key so that an edited
+    file is read again.
+    
+    Args:
+        config_path (str): Path to the markdownlint configuration file
+        mtime (float): Modification time of the file
+        
+    Returns:
+        dict: Configuration settings
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+        
+    # Extract relevant settings
+    result = {}
+    result["line_length"] = config.get("MD013", {}).get(
+        "line_length", 120)
+    
+    heading_style = config.get("MD003", {}).get("style", "atx")
+    result["heading_style"] = heading_style
+    
+    list_indent = config.get("MD007", {}).get("indent", 2)
+    result["list_indent"] = list_indent
+    
+    return result
+
 
 def load_markdownlint_config(config_path='.markdownlint.json'):
     """
@@ -49,21 +112,10 @@ def load_markdownlint_config(config_path='.markdownlint.json'):
     
     try:
         if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                
-            # Extract relevant settings
-            result = {}
-            result["line_length"] = config.get("MD013", {}).get(
-                "line_length", 120)
-            
-            heading_style = config.get("MD003", {}).get("style", "atx")
-            result["heading_style"] = heading_style
-            
-            list_indent = config.get("MD007", {}).get("indent", 2)
-            result["list_indent"] = list_indent
-            
-            return result
+            # Copy so callers can override settings without touching the
+            # cached entry
+            return dict(_read_markdownlint_config(
+                config_path, os.path.getmtime(config_path)))
         else:
             logger.warning(
                 f"Markdownlint config not found at {config_path}, using defaults")
@@ -73,59 +125,172 @@ def load_markdownlint_config(config_path='.markdownlint.json'):
         return default_config
 
 
-def fix_line_length(content, max_length=120):
+class _CodeBlock(str):
     """
-    Fix line length issues by breaking long lines appropriately.
+    A fenced code block travelling through the fixer stages as one item.
+    
+    The string value is the whole block, fences included, so joining the
+    stage output with newlines restores it unchanged. Stages recognize it
+    with isinstance() and pass it through instead of tracking whether
+    they are inside a code block.
+    """
+    
+    def __new__(cls, lines, closed=True):
+        block = super().__new__(cls, '\n'.join(lines))
+        block.lines = lines
+        block.closed = closed
+        return block
+
+
+def _mask_code_blocks(lines):
+    """
+    Group each fenced code block into a single _CodeBlock item.
+    
+    A block runs from a line starting with ``` to the next such line, or
+    to the end of the document if it is never closed.
     
     Args:
-        content (str): The markdown content to fix
-        max_length (int): Maximum line length
+        lines (iterable): Markdown lines without trailing newlines
+        
+    Yields:
+        str: Lines outside code blocks, and one _CodeBlock per block
+    """
+    block = None
+    for line in lines:
+        is_fence = line.strip().startswith('```')
+        if block is not None:
+            block.append(line)
+            if is_fence:
+                yield _CodeBlock(block)
+                block = None
+        elif is_fence:
+            block = [line]
+        else:
+            yield line
+    if block is not None:
+        yield _CodeBlock(block, closed=False)
+
+
+def _is_list_item(line):
+    """
+    Check whether a line starts a bullet or ordered list item.
+    
+    Uses plain string methods instead of a regex, so prose lines are
+    rejected after a single character test.
+    
+    Args:
+        line (str): The line to check
         
     Returns:
-        str: Fixed content with proper line lengths
+        bool: True if the line is a list item
     """
-    lines = content.split('\n')
-    fixed_lines = []
-    in_code_block = False
+    s = line.lstrip()
+    if not s:
+        return False
+    c = s[0]
+    if c in '-*+':
+        return s[1:2].isspace()
+    if c.isdecimal():
+        i = 1
+        n = len(s)
+        while i < n and s[i].isdecimal():
+            i += 1
+        return s[i:i + 1] == '.' and s[i + 1:i + 2].isspace()
+    return False
+
+
+def _find_break(text, limit):
+    """
+    Find where to break text so that the first part fits within limit.
+    
+    Args:
+        text (str): The text to break
+        limit (int): Maximum length of the first part
+        
+    Returns:
+        int: Index of the space to break at, or -1 if there is none
+    """
+    best_break = -1
+    for bp in _BREAK_POINTS:
+        pos = text.rfind(bp, 0, limit)
+        if pos > best_break:
+            # Every break point ends with a space; break on that space
+            best_break = pos + len(bp) - 1
+    return best_break
+
+
+def _find_link(line):
+    """
+    Find the first inline link to an http(s) URL, like [text](http...).
+    
+    Scans with str.find instead of a regex: searching for the pattern
+    with re backtracks quadratically on lines with many unclosed '['.
+    
+    Args:
+        line (str): The line to search
+        
+    Returns:
+        int: Index of the link's opening '[', or -1 if there is none
+    """
+    # The link text can't be empty, so '](http' is at index 2 or later
+    pos = line.find('](http', 2)
+    while pos != -1:
+        # The text can't contain ']', so the link starts at the first '['
+        # after the previous ']', leaving at least one character of text
+        start = line.find('[', line.rfind(']', 0, pos) + 1, pos - 1)
+        if start != -1:
+            close = line.find(')', pos + 6)
+            if close == -1:
+                # Nothing later can be closed either
+                return -1
+            # The URL needs at least one character after 'http'
+            if close > pos + 6:
+                return start
+        pos = line.find('](http', pos + 1)
+    return -1
+
+
+def _line_length_stage(lines, max_length=120):
+    """
+    Break long lines at natural points (generator stage of fix_line_length).
+    
+    Args:
+        lines (iterable): Markdown lines, with code blocks grouped by
+            _mask_code_blocks
+        max_length (int): Maximum line length
     
+    Yields:
+        str: Lines with proper lengths
+    """
     for line in lines:
-        # Skip code blocks as they're exempt from line length rules
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
-            fixed_lines.append(line)
+        # Short lines are the common case, so test the length first
+        if len(line) <= max_length:
+            yield line
             continue
         
-        if in_code_block:
-            fixed_lines.append(line)
+        # Skip code blocks as they're exempt from line length rules
+        if isinstance(line, _CodeBlock):
+            yield line
             continue
-            
+        
         # Skip headings, they shouldn't be broken
-        if line.strip().startswith('#'):
-            fixed_lines.append(line)
-            continue
-            
-        if len(line) <= max_length:
-            fixed_lines.append(line)
+        stripped = line.strip()
+        if stripped.startswith('#'):
+            yield line
         else:
+            # Computed once; every branch below reuses it for continuations
+            indent = len(line) - len(line.lstrip())
+            
             # Handle different types of long lines
-            if line.strip().startswith('- ') or line.strip().startswith('* '):
+            if stripped.startswith(('- ', '* ')):
                 # List item - break after reasonable points
-                indent = len(line) - len(line.lstrip())
                 prefix = line[:indent + 2]  # Include indent and list marker
                 rest = line[indent + 2:]
+                width = max_length - len(prefix)
                 
-                if len(rest) > max_length - len(prefix):
+                if len(rest) > width:
                     # Try to break at sentence boundaries or commas
-                    break_points = [
-                        '. ', ', ', ': ', '; ', ' - ', ' and ', ' or ', ' but ']
-                    best_break = -1
-                    
-                    for bp in break_points:
-                        pos = rest.rfind(bp, 0, max_length - len(prefix))
-                        if pos > best_break:
-                            best_break = (
-                                pos + len(bp) - 1 if bp.endswith(' ')
-                                else pos + len(bp))
+                    best_break = _find_break(rest, width)
                     
                     # If no good break point found, try breaking at a word
                     # boundary
@@ -133,492 +298,722 @@ def fix_line_length(content, max_length=120):
                         words = rest.split()
                         current_len = 0
                         for i, word in enumerate(words):
-                            if (current_len + len(word) + 1 >
-                                    max_length - len(prefix)):
+                            if current_len + len(word) + 1 > width:
                                 if i > 0:  # We have at least one word
                                     best_break = current_len
                                 break
                             current_len += len(word) + 1  # +1 for the space
                     
                     if best_break > 0:
-                        fixed_lines.append(prefix + rest[:best_break].rstrip())
+                        yield prefix + rest[:best_break].rstrip()
                         # Continue with remaining text on new line with proper
                         # indentation
                         remaining = rest[best_break:].lstrip()
                         if remaining:
-                            fixed_lines.append(' ' * (indent + 2) + remaining)
+                            yield ' ' * (indent + 2) + remaining
                     else:
                         # If we can't find a good break point, keep the line as is
-                        fixed_lines.append(line)
+                        yield line
                 else:
-                    fixed_lines.append(line)
+                    yield line
             else:
                 # For other long lines, try to break at natural points
                 if '](http' in line:
                     # Markdown link - try to break before the link
-                    match = re.search(r'\[([^\]]+)\]\(http[^)]+\)', line)
-                    if match and match.start() < max_length:
-                        before = line[:match.start()].rstrip()
-                        link_part = line[match.start():]
+                    link_start = _find_link(line)
+                    if link_start != -1 and link_start < max_length:
+                        before = line[:link_start].rstrip()
+                        link_part = line[link_start:]
                         if before:
-                            fixed_lines.append(before)
-                            fixed_lines.append(link_part)
+                            yield before
+                            yield link_part
                         else:
-                            fixed_lines.append(line)
+                            yield line
                     else:
                         # Try to break at other points
-                        break_points = [
-                            '. ', ', ', ': ', '; ', ' - ', ' and ', ' or ', ' but ']
-                        best_break = -1
-                        
-                        for bp in break_points:
-                            pos = line.rfind(bp, 0, max_length)
-                            if pos > best_break:
-                                best_break = (
-                                    pos + len(bp) - 1 if bp.endswith(' ')
-                                    else pos + len(bp))
+                        best_break = _find_break(line, max_length)
                         
                         if best_break > 0:
-                            fixed_lines.append(line[:best_break].rstrip())
+                            yield line[:best_break].rstrip()
                             remaining = line[best_break:].lstrip()
                             if remaining:
-                                # Check indentation level for continuation
-                                indent = len(line) - len(
-                                    line.lstrip())
-                                fixed_lines.append(' ' * indent + remaining)
+                                yield ' ' * indent + remaining
                         else:
-                            fixed_lines.append(line)
+                            yield line
                 else:
                     # Try to break at punctuation or conjunctions
-                    break_points = [
-                        '. ', ', ', ': ', '; ', ' - ', ' and ', ' or ', ' but ']
-                    best_break = -1
-                    
-                    for bp in break_points:
-                        pos = line.rfind(bp, 0, max_length)
-                        if pos > best_break:
-                            best_break = (
-                                pos + len(bp) - 1 if bp.endswith(' ')
-                                else pos + len(bp))
+                    best_break = _find_break(line, max_length)
                     
                     if best_break > 0:
-                        fixed_lines.append(line[:best_break].rstrip())
+                        yield line[:best_break].rstrip()
                         remaining = line[best_break:].lstrip()
                         if remaining:
-                            # Check indentation level for continuation
-                            indent = len(line) - len(
-                                line.lstrip())
-                            fixed_lines.append(' ' * indent + remaining)
+                            yield ' ' * indent + remaining
                     else:
                         # If no good break point, try to break at a word boundary
                         words = line.split()
                         if len(words) > 1:
                             current_len = 0
-                            indent = len(line) - len(line.lstrip())
-                            current_line = ' ' * indent
+                            pad = ' ' * indent
+                            current_line = pad
                             
                             for word in words:
                                 if (current_len + len(word) + 1 >
                                         max_length):
-                                    fixed_lines.append(current_line.rstrip())
-                                    current_line = ' ' * indent + word + ' '
+                                    yield current_line.rstrip()
+                                    current_line = pad + word + ' '
                                     current_len = len(current_line)
                                 else:
                                     current_line += word + ' '
                                     current_len += len(word) + 1
                             
                             if current_line.strip():
-                                fixed_lines.append(current_line.rstrip())
+                                yield current_line.rstrip()
                         else:
                             # Single long word, can't break nicely
-                            fixed_lines.append(line)
-    
-    return '\n'.join(fixed_lines)
+                            yield line
 
 
-def fix_fenced_code_blocks(content):
+def fix_line_length(content, max_length=120):
     """
-    Add language specification to fenced code blocks.
+    Fix line length issues by breaking long lines appropriately.
     
     Args:
         content (str): The markdown content to fix
-        
+        max_length (int): Maximum line length
+    
     Returns:
-        str: Fixed content with language-specified code blocks
+        str: Fixed content with proper line lengths
     """
-    # Pattern to find fenced code blocks without language
-    pattern = r'^```\s*$'
     lines = content.split('\n')
-    fixed_lines = []
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if re.match(pattern, line):
-            # Look ahead to determine the appropriate language
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                
-                # Determine language based on content
-                if (next_line.startswith('docker ') or 
-                        next_line.startswith('docker-compose')):
-                    fixed_lines.append('```bash')
-                elif (next_line.startswith('npm ') or 
-                      next_line.startswith('node ')):
-                    fixed_lines.append('```bash')
-                elif (next_line.startswith('git ') or 
-                      next_line.startswith('cd ')):
-                    fixed_lines.append('```bash')
-                elif (next_line.startswith('make ') or 
-                      next_line.startswith('sudo ')):
-                    fixed_lines.append('```bash')
-                elif (next_line.startswith('curl ') or 
-                      next_line.startswith('wget ')):
-                    fixed_lines.append('```bash')
-                elif ('version:' in next_line or 
-                      'services:' in next_line):
-                    fixed_lines.append('```yaml')
-                elif (next_line.startswith('{') or 
-                      next_line.startswith('[')):
-                    fixed_lines.append('```json')
-                elif (next_line.startswith('<') and 
-                      ('>' in next_line)):
-                    fixed_lines.append('```html')
-                elif ('def ' in next_line or 
-                      'import ' in next_line or 
-                      next_line.startswith('class ')):
-                    fixed_lines.append('```python')
-                elif ('function ' in next_line or 
-                      'const ' in next_line or 
-                      'var ' in next_line or 
-                      'let ' in next_line):
-                    fixed_lines.append('```javascript')
-                elif ('SELECT ' in next_line.upper() or 
-                      'CREATE TABLE' in next_line.upper()):
-                    fixed_lines.append('```sql')
-                elif ('#!/bin/bash' in next_line or 
-                      '#!/usr/bin/env bash' in next_line):
-                    fixed_lines.append('```bash')
-                elif '#!/usr/bin/env python' in next_line:
-                    fixed_lines.append('```python')
-                elif ('#include ' in next_line or 
-                      'int main' in next_line):
-                    fixed_lines.append('```c')
-                else:
-                    # Default to bash for shell commands
-                    fixed_lines.append('```bash')
+    # Most files have no long lines at all; skip the stage entirely
+    if max(map(len, lines)) <= max_length:
+        return content
+    return '\n'.join(_line_length_stage(_mask_code_blocks(lines), max_length))
+
+
+def _guess_code_language(line):
+    """
+    Guess the language of a code block from its first line.
+    
+    Args:
+        line (str): The stripped first line of the code block
+        
+    Returns:
+        str: Language name for the opening fence
+    """
+    if line.startswith(_SHELL_PREFIXES):
+        return 'bash'
+    if 'version:' in line or 'services:' in line:
+        return 'yaml'
+    if line.startswith(('{', '[')):
+        return 'json'
+    if line.startswith('<') and '>' in line:
+        return 'html'
+    if 'def ' in line or 'import ' in line or line.startswith('class '):
+        return 'python'
+    if ('function ' in line or 'const ' in line or
+            'var ' in line or 'let ' in line):
+        return 'javascript'
+    upper = line.upper()
+    if 'SELECT ' in upper or 'CREATE TABLE' in upper:
+        return 'sql'
+    if '#!/bin/bash' in line or '#!/usr/bin/env bash' in line:
+        return 'bash'
+    if '#!/usr/bin/env python' in line:
+        return 'python'
+    if '#include ' in line or 'int main' in line:
+        return 'c'
+    # Default to bash for shell commands
+    return 'bash'
+
+
+def _fenced_code_blocks_stage(lines):
+    """
+    Add a language to bare code fences (generator stage of
+    fix_fenced_code_blocks).
+    
+    Args:
+        lines (iterable): Markdown lines, with code blocks grouped by
+            _mask_code_blocks
+    
+    Yields:
+        str: Lines with language-specified code fences
+    """
+    lines = iter(lines)
+    line = next(lines, None)
+    
+    while line is not None:
+        next_line = next(lines, None)
+        if not isinstance(line, _CodeBlock):
+            yield line
+            line = next_line
+            continue
+        
+        # A bare fence has no language and nothing but whitespace after
+        # it. Indented fences are left untouched
+        block = list(line.lines)
+        if block[0].rstrip() == '```':
+            # Guess from the first line of code
+            if len(block) > 1:
+                block[0] = '```' + _guess_code_language(block[1].strip())
             else:
-                fixed_lines.append('```bash')
+                block[0] = '```bash'
+        if line.closed and block[-1].rstrip() == '```':
+            # The closing fence is tagged from the line after the block
+            if isinstance(next_line, _CodeBlock):
+                following = next_line.lines[0]
+            else:
+                following = next_line
+            if following is not None:
+                block[-1] = '```' + _guess_code_language(following.strip())
+            else:
+                block[-1] = '```bash'
+        
+        if block == line.lines:
+            yield line
         else:
-            fixed_lines.append(line)
-        i += 1
-    
-    return '\n'.join(fixed_lines)
+            yield _CodeBlock(block, line.closed)
+        line = next_line
 
 
-def fix_ordered_list_prefixes(content):
+def fix_fenced_code_blocks(content):
     """
-    Fix ordered list prefix issues.
+    Add language specification to fenced code blocks.
     
     Args:
         content (str): The markdown content to fix
-        
+    
     Returns:
-        str: Fixed content with correct ordered list numbering
+        str: Fixed content with language-specified code blocks
     """
-    lines = content.split('\n')
-    fixed_lines = []
+    if '```' not in content:
+        return content
+    lines = _mask_code_blocks(content.split('\n'))
+    return '\n'.join(_fenced_code_blocks_stage(lines))
+
+
+def _reset_list_counters(list_counters, other_counters, width):
+    """
+    Forget the lists open at an indentation of width characters or more.
+    
+    Args:
+        list_counters (list): Counters for space-only indents, by width
+        other_counters (dict): Counters for other indents, by indent
+        width (int): Indentation width of the line that ends the lists
+    """
+    del list_counters[width:]
+    if other_counters:
+        for indent in [i for i in other_counters if len(i) >= width]:
+            del other_counters[indent]
+
+
+def _ordered_list_prefixes_stage(lines):
+    """
+    Renumber ordered list items (generator stage of
+    fix_ordered_list_prefixes).
+    
+    Args:
+        lines (iterable): Markdown lines, with code blocks grouped by
+            _mask_code_blocks
     
-    # Track list items at different indentation levels
-    list_counters = {}
-    in_code_block = False
+    Yields:
+        str: Lines with correct ordered list numbering
+    """
+    # Next number for the list open at each space-only indentation,
+    # indexed by width; 0 means no list is open at that width
+    list_counters = []
+    # Indents containing tabs or other whitespace aren't a column count,
+    # so their lists are tracked by the exact indent string instead
+    other_counters = {}
+    prev_is_item = False
+    # Set by a blank line; counters are trimmed once the next non-blank
+    # line shows the indentation the document continues at
+    pending_reset = False
     
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+    for line in lines:
+        ol_match = None
         
         # Skip modifying code blocks
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
-            fixed_lines.append(line)
-            i += 1
+        if isinstance(line, _CodeBlock):
+            if pending_reset:
+                # The block's opening fence is the next non-blank line
+                fence = line.lines[0]
+                _reset_list_counters(
+                    list_counters, other_counters,
+                    len(fence) - len(fence.lstrip()))
+                pending_reset = False
+            yield line
+            prev_is_item = False
             continue
         
-        if in_code_block:
-            fixed_lines.append(line)
-            i += 1
-            continue
+        stripped = line.strip()
+        if pending_reset and stripped != '':
+            # Reset counters for all indentation levels greater than or
+            # equal to this line. This handles the case where a new list
+            # starts after a blank line
+            next_indent = len(line) - len(line.lstrip())
+            _reset_list_counters(list_counters, other_counters, next_indent)
+            pending_reset = False
         
-        # Check if this is an ordered list item
-        ol_match = re.match(r'^(\s*)(\d+)\.\s(.*)$', line)
+        # Check if this is an ordered list item; only a leading digit
+        # can start one, so most lines never reach the regex
+        if stripped[:1].isdecimal():
+            ol_match = _OL_RE.match(line)
         if ol_match:
             indent = ol_match.group(1)
             current_num = int(ol_match.group(2))
-            content = ol_match.group(3)
-            
-            # Reset counter if this is a new list
-            if (i == 0 or lines[i-1].strip() == '' or 
-                    not re.match(r'^\s*\d+\.\s', lines[i-1])):
-                list_counters[indent] = 1
-            
-            # Get the correct number for this item
-            correct_num = list_counters.get(indent, 1)
-            
-            # Update the counter for next item at this indentation level
-            list_counters[indent] = correct_num + 1
+            text = ol_match.group(3)
+            if indent.strip(' '):
+                # Reset counter if this is a new list
+                if not prev_is_item:
+                    other_counters[indent] = 1
+                
+                # Get the correct number for this item
+                correct_num = other_counters.get(indent, 1)
+                
+                # Update the counter for next item at this indentation
+                other_counters[indent] = correct_num + 1
+            else:
+                width = len(indent)
+                if width >= len(list_counters):
+                    list_counters.extend(
+                        [0] * (width + 1 - len(list_counters)))
+                
+                if not prev_is_item:
+                    list_counters[width] = 1
+                correct_num = list_counters[width] or 1
+                list_counters[width] = correct_num + 1
             
             # Fix the numbering if needed
             if current_num != correct_num:
-                fixed_lines.append(f"{indent}{correct_num}. {content}")
+                yield f"{indent}{correct_num}. {text}"
             else:
-                fixed_lines.append(line)
+                yield line
         else:
-            fixed_lines.append(line)
+            yield line
             
             # If we hit a blank line, we might be ending a list at some levels
-            if line.strip() == '':
-                # Find all indentation levels greater than or equal to the next non-blank line
-                next_indent = ''
-                for j in range(i + 1, len(lines)):
-                    if lines[j].strip() != '':
-                        next_indent = len(lines[j]) - len(lines[j].lstrip())
-                        break
-                
-                # Reset counters for all indentation levels greater than the next non-blank line
-                # This handles the case where a new list starts after a blank line
-                keys_to_remove = []
-                for indent in list_counters:
-                    # Compare lengths of strings, not string to int
-                    if isinstance(next_indent, int):
-                        if len(indent) >= next_indent:
-                            keys_to_remove.append(indent)
-                    else:
-                        if len(indent) >= len(next_indent):
-                            keys_to_remove.append(indent)
-                
-                for key in keys_to_remove:
-                    del list_counters[key]
-                    
-        i += 1
-    
-    return '\n'.join(fixed_lines)
+            if stripped == '':
+                pending_reset = True
+        
+        prev_is_item = ol_match is not None
 
 
-def fix_trailing_whitespace(content):
+def fix_ordered_list_prefixes(content):
     """
-    Remove trailing whitespace from lines (MD009).
+    Fix ordered list prefix issues.
     
     Args:
         content (str): The markdown content to fix
-        
+    
     Returns:
-        str: Fixed content with trailing whitespace removed
+        str: Fixed content with correct ordered list numbering
     """
-    lines = content.split('\n')
-    fixed_lines = []
+    if not _OL_LINE_RE.search(content):
+        return content
+    lines = _mask_code_blocks(content.split('\n'))
+    return '\n'.join(_ordered_list_prefixes_stage(lines))
+
+
+def _trailing_whitespace_stage(lines):
+    """
+    Strip trailing whitespace (stage of fix_trailing_whitespace).
     
-    for line in lines:
-        fixed_lines.append(line.rstrip())
+    Args:
+        lines (iterable): Markdown lines without trailing newlines
     
-    return '\n'.join(fixed_lines)
+    Returns:
+        iterator: Lines without trailing whitespace
+    """
+    # map() keeps the per-line loop in C; no Python frame per line
+    return map(str.rstrip, lines)
 
 
-def fix_blank_lines(content):
+def fix_trailing_whitespace(content):
     """
-    Ensure proper blank lines around elements (MD022, MD023, etc.)
+    Remove trailing whitespace from lines (MD009).
     
     Args:
         content (str): The markdown content to fix
-        
+    
     Returns:
-        str: Fixed content with proper blank lines
+        str: Fixed content with trailing whitespace removed
     """
-    lines = content.split('\n')
-    fixed_lines = []
-    in_code_block = False
+    return '\n'.join(_trailing_whitespace_stage(content.split('\n')))
+
+
+def _blank_lines_stage(lines):
+    """
+    Insert blank lines around elements (generator stage of fix_blank_lines).
+    
+    Args:
+        lines (iterable): Markdown lines, with code blocks grouped by
+            _mask_code_blocks
     
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+    Yields:
+        str: Lines with blank lines inserted, not yet deduplicated
+    """
+    lines = iter(lines)
+    line = next(lines, None)
+    # Last line emitted by this stage, None until the first one
+    last = None
+    
+    while line is not None:
+        next_line = next(lines, None)
         
         # Handle code blocks
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
-            
+        if isinstance(line, _CodeBlock):
             # Add blank line before code block if needed
-            if not in_code_block:  # End of code block
-                fixed_lines.append(line)
-                if (i + 1 < len(lines) and 
-                        lines[i + 1].strip() != '' and 
-                        not lines[i + 1].strip().startswith('#')):
-                    fixed_lines.append('')
-            else:  # Start of code block
-                if i > 0 and fixed_lines and fixed_lines[-1].strip() != '':
-                    fixed_lines.append('')
-                fixed_lines.append(line)
-        elif in_code_block:
-            fixed_lines.append(line)
+            if last is not None and last.strip() != '':
+                yield ''
+            yield line
+            last = line
+            # And after it, unless a heading follows
+            if (line.closed and next_line is not None and
+                    next_line.strip() != '' and
+                    not next_line.strip().startswith('#')):
+                yield ''
+                last = ''
         # Handle headings - ensure blank line before and after
         elif line.strip().startswith('#'):
             # Add blank line before heading if needed
-            if i > 0 and fixed_lines and fixed_lines[-1].strip() != '':
-                fixed_lines.append('')
-            fixed_lines.append(line)
+            if last is not None and last.strip() != '':
+                yield ''
+            yield line
+            last = line
             # Add blank line after heading if needed
-            if i + 1 < len(lines) and lines[i + 1].strip() != '':
-                fixed_lines.append('')
+            if next_line is not None and next_line.strip() != '':
+                yield ''
+                last = ''
         # Handle list items
-        elif (re.match(r'^\s*[-*+]\s', line) or 
-              re.match(r'^\s*\d+\.\s', line)):
+        elif _is_list_item(line):
             # For list items, we don't add blank lines between items
             # But we do add a blank line before a list starts
-            if i > 0 and fixed_lines:
-                prev_line = fixed_lines[-1].strip()
-                is_prev_list = (re.match(r'^\s*[-*+]\s', prev_line) or 
-                                re.match(r'^\s*\d+\.\s', prev_line))
-                if prev_line != '' and not is_prev_list:
-                    fixed_lines.append('')
-            fixed_lines.append(line)
+            if last is not None:
+                prev_line = last.strip()
+                if prev_line != '' and not _is_list_item(prev_line):
+                    yield ''
+            yield line
+            last = line
         else:
-            fixed_lines.append(line)
+            yield line
+            last = line
         
-        i += 1
+        line = next_line
+
+
+def _collapse_blank_lines_stage(lines):
+    """
+    Collapse runs of blank lines into a single blank line.
     
-    # Clean up multiple blank lines
-    cleaned_lines = []
+    Args:
+        lines (iterable): Markdown lines, with code blocks grouped by
+            _mask_code_blocks
+    
+    Yields:
+        str: Lines with no consecutive blank lines
+    """
     prev_blank = False
-    for line in fixed_lines:
-        if line.strip() == '':
+    for line in lines:
+        if isinstance(line, _CodeBlock):
+            # Runs of blank lines inside code blocks are collapsed too
+            block = list(_collapse_blank_lines_stage(line.lines))
+            if len(block) != len(line.lines):
+                line = _CodeBlock(block, line.closed)
+            yield line
+            prev_blank = False
+        elif line.strip() == '':
             if not prev_blank:
-                cleaned_lines.append(line)
+                yield line
             prev_blank = True
         else:
-            cleaned_lines.append(line)
+            yield line
             prev_blank = False
-    
-    return '\n'.join(cleaned_lines)
 
 
-def fix_list_indent_consistency(content, indent=2):
+def fix_blank_lines(content):
     """
-    Ensure list indentation is consistent (MD007).
+    Ensure proper blank lines around elements (MD022, MD023, etc.)
     
     Args:
         content (str): The markdown content to fix
-        indent (int): The number of spaces to use for list indentation
-        
+    
     Returns:
-        str: Fixed content with consistent list indentation
+        str: Fixed content with proper blank lines
     """
-    lines = content.split('\n')
-    fixed_lines = []
-    in_code_block = False
+    lines = _blank_lines_stage(_mask_code_blocks(content.split('\n')))
+    return '\n'.join(_collapse_blank_lines_stage(lines))
+
+
+def _list_indent_consistency_stage(lines, indent=2):
+    """
+    Normalize bullet list indentation (generator stage of
+    fix_list_indent_consistency).
     
+    Args:
+        lines (iterable): Markdown lines, with code blocks grouped by
+            _mask_code_blocks
+        indent (int): The number of spaces to use for list indentation
+    
+    Yields:
+        str: Lines with consistent list indentation
+    """
     for line in lines:
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
-            fixed_lines.append(line)
-            continue
-            
-        if in_code_block:
-            fixed_lines.append(line)
+        if isinstance(line, _CodeBlock):
+            yield line
             continue
-            
+        
         # Check for list items
-        list_match = re.match(r'^(\s*)[-*+]\s', line)
+        list_match = _UL_RE.match(line)
         if list_match:
             leading_space = list_match.group(1)
             # Calculate the list level (how nested is this list item)
             level = len(leading_space) // indent
             if level == 0:
                 # Top level list item, no indentation needed
-                fixed_line = re.sub(r'^\s*', '', line, 1)
-                fixed_lines.append(fixed_line)
+                yield _LEADING_WS_RE.sub('', line, 1)
             else:
                 # Nested list item, ensure proper indentation
                 correct_indent = ' ' * (level * indent)
-                fixed_line = re.sub(r'^\s*', correct_indent, line, 1)
-                fixed_lines.append(fixed_line)
+                yield _LEADING_WS_RE.sub(correct_indent, line, 1)
         else:
-            fixed_lines.append(line)
-    
-    return '\n'.join(fixed_lines)
+            yield line
 
 
-def fix_heading_style(content, style='atx'):
+def fix_list_indent_consistency(content, indent=2):
     """
-    Ensure heading style is consistent (MD003).
+    Ensure list indentation is consistent (MD007).
     
     Args:
         content (str): The markdown content to fix
-        style (str): The heading style to use ('atx' or 'setext')
+        indent (int): The number of spaces to use for list indentation
+    
+    Returns:
+        str: Fixed content with consistent list indentation
+    """
+    if not _UL_LINE_RE.search(content):
+        return content
+    lines = _mask_code_blocks(content.split('\n'))
+    return '\n'.join(_list_indent_consistency_stage(lines, indent))
+
+
+def _parse_atx_heading(line):
+    """
+    Split an ATX heading such as '## Title ##' into its level and text.
+    
+    Parses with str methods rather than a regex: the equivalent pattern
+    backtracks quadratically on headings with long runs of whitespace.
+    
+    Args:
+        line (str): The line to parse
         
     Returns:
-        str: Fixed content with consistent heading style
+        tuple: (level, text) with the text stripped, or None if the line
+            is not an ATX heading
     """
-    lines = content.split('\n')
-    fixed_lines = []
-    in_code_block = False
+    rest = line.lstrip('#')
+    level = len(line) - len(rest)
+    # The opening '#'s must be followed by whitespace
+    if not level or not rest[:1].isspace():
+        return None
+    text = rest.lstrip()
+    if not text:
+        # A heading with no text needs at least two whitespace characters
+        return (level, '') if len(rest) > 1 else None
+    # Drop a closing run of '#'s, but only when whitespace separates it
+    # from the text
+    body = text.rstrip('#')
+    if body[-1:].isspace():
+        text = body
+    return level, text.strip()
+
+
+def _heading_style_stage(lines, style='atx'):
+    """
+    Convert headings to one style (generator stage of fix_heading_style).
     
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+    Args:
+        lines (iterable): Markdown lines, with code blocks grouped by
+            _mask_code_blocks
+        style (str): The heading style to use ('atx' or 'setext')
+    
+    Yields:
+        str: Lines with consistent heading style
+    """
+    lines = iter(lines)
+    line = next(lines, None)
+    
+    while line is not None:
+        next_line = next(lines, None)
         
-        if line.strip().startswith('```'):
-            in_code_block = not in_code_block
-            fixed_lines.append(line)
-            i += 1
-            continue
-            
-        if in_code_block:
-            fixed_lines.append(line)
-            i += 1
+        if isinstance(line, _CodeBlock):
+            yield line
+            line = next_line
             continue
         
         # Check for setext-style headings (underlining with === or ---)
-        if i < len(lines) - 1:
-            next_line = lines[i + 1]
-            if (next_line.strip() and 
-                    (all(c == '=' for c in next_line.strip()) or 
+        if next_line is not None:
+            if (next_line.strip() and
+                    (all(c == '=' for c in next_line.strip()) or
                      all(c == '-' for c in next_line.strip()))):
                 if style == 'atx':
                     # Convert to ATX style
                     level = 1 if '=' in next_line else 2
-                    fixed_lines.append('#' * level + ' ' + line.strip())
-                    i += 2  # Skip the underline
-                    continue
+                    yield '#' * level + ' ' + line.strip()
                 else:
                     # Keep setext style
-                    fixed_lines.append(line)
-                    fixed_lines.append(next_line)
-                    i += 2
-                    continue
-        
-        # Check for ATX-style headings
-        atx_match = re.match(r'^(#+)\s+(.+?)(\s+#+)?$', line)
-        if atx_match:
+                    yield line
+                    yield next_line
+                line = next(lines, None)  # Skip the underline
+                continue
+        
+        # Check for ATX-style headings. Only a line starting with '#' can
+        # be one, so most lines skip the parse entirely
+        if line.startswith('#'):
+            atx_heading = _parse_atx_heading(line)
+        else:
+            atx_heading = None
+        if atx_heading:
+            level, heading_text = atx_heading
             if style == 'atx':
                 # Normalize ATX style (remove closing #s)
-                level = len(atx_match.group(1))
-                heading_text = atx_match.group(2).strip()
-                fixed_lines.append('#' * level + ' ' + heading_text)
+                yield '#' * level + ' ' + heading_text
             else:
                 # Convert to setext style (only for level 1 and 2)
-                level = len(atx_match.group(1))
-                heading_text = atx_match.group(2).strip()
                 if level <= 2:
-                    fixed_lines.append(heading_text)
-                    fixed_lines.append(
-                        '=' if level == 1 else '-' * len(heading_text))
+                    yield heading_text
+                    yield '=' if level == 1 else '-' * len(heading_text)
                 else:
                     # Can't convert level 3+ to setext, keep as ATX
-                    fixed_lines.append('#' * level + ' ' + heading_text)
+                    yield '#' * level + ' ' + heading_text
         else:
-            fixed_lines.append(line)
+            yield line
+        
+        line = next_line
+
+
+def fix_heading_style(content, style='atx'):
+    """
+    Ensure heading style is consistent (MD003).
+    
+    Args:
+        content (str): The markdown content to fix
+        style (str): The heading style to use ('atx' or 'setext')
+    
+    Returns:
+        str: Fixed content with consistent heading style
+    """
+    lines = _mask_code_blocks(content.split('\n'))
+    return '\n'.join(_heading_style_stage(lines, style))
+
+
+def fix_all(content, config, fixes=None):
+    """
+    Apply every fix, or a selection of them, in a single pass.
+    
+    Equivalent to running the selected fix_* functions in turn, but the
+    content is split and joined only once: every line flows through the
+    chained generator stages instead of each fixer building its own list
+    and string.
+    
+    Args:
+        content (str): The markdown content to fix
+        config (dict): Configuration settings from markdownlint
+        fixes (list): Names of the fixes to apply, or None for all fixes
+    
+    Returns:
+        str: Fixed content
+    """
+    if fixes is None:
+        fixes = _ALL_FIXES
+    
+    lines = content.split('\n')
+    if 'whitespace' in fixes:
+        lines = _trailing_whitespace_stage(lines)
+    # Group code blocks once; every later stage passes them through whole
+    lines = _mask_code_blocks(lines)
+    # Leave out stages that have nothing to act on in this file. Earlier
+    # stages never create lines these probes look for, so probing the
+    # original content is enough
+    if 'code-blocks' in fixes and '```' in content:
+        lines = _fenced_code_blocks_stage(lines)
+    if 'lists' in fixes:
+        if _OL_LINE_RE.search(content):
+            lines = _ordered_list_prefixes_stage(lines)
+        if _UL_LINE_RE.search(content):
+            lines = _list_indent_consistency_stage(
+                lines, config.get('list_indent', 2))
+    if 'headings' in fixes:
+        lines = _heading_style_stage(
+            lines, config.get('heading_style', 'atx'))
+    if 'blank-lines' in fixes:
+        lines = _collapse_blank_lines_stage(_blank_lines_stage(lines))
+    if 'line-length' in fixes:
+        lines = _line_length_stage(lines, config.get('line_length', 120))
+    return '\n'.join(lines)
+
+
+def _read_markdown(filepath):
+    """
+    Read a markdown file as text, translating newlines like text mode.
+    
+    Large files are decoded directly from a memory map so that the raw
+    bytes are never copied into the Python heap alongside the text.
+    
+    Args:
+        filepath (str): Path to the markdown file
         
-        i += 1
+    Returns:
+        str: The file content
+    """
+    if os.path.getsize(filepath) <= _MMAP_THRESHOLD:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        content = str(mm, 'utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _write_atomic(filepath, content):
+    """
+    Atomically replace the content of a text file, creating it if needed.
+    
+    The content is written to a temporary file next to the target, which
+    is then renamed over it, so an interrupted run never leaves a
+    truncated file behind. Symlinks are followed and the original file
+    mode is kept.
     
-    return '\n'.join(fixed_lines)
+    Args:
+        filepath (str): Path to the file
+        content (str): The new content
+    """
+    target = os.path.realpath(filepath)
+    tmp = tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', dir=os.path.dirname(target),
+        prefix='.' + os.path.basename(target) + '.', suffix='.tmp',
+        delete=False)
+    try:
+        with tmp:
+            tmp.write(content)
+        if os.path.exists(target):
+            shutil.copymode(target, tmp.name)
+        else:
+            # A new file gets the usual mode, not the temp file's 0600
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp.name, 0o666 & ~umask)
+        os.replace(tmp.name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
 
 
 def fix_markdown_file(filepath, config, dry_run=False, fixes=None):
@@ -632,9 +1027,15 @@ def fix_markdown_file(filepath, config, dry_run=False, fixes=None):
         fixes (list): List of fixes to apply, or None for all fixes
         
     Returns:
-        bool: True if changes were made, False otherwise
+        bool: True if changes were made, False if none were needed, or
+            None if the file could not be processed
     """
-    logger.info(f"Processing {filepath}...")
+    # Per-file progress is debug output: on a large, mostly clean tree it
+    # would otherwise be most of the logging, and every record takes the
+    # handler lock. main() reports the totals at the end
+    verbose = logger.isEnabledFor(logging.DEBUG)
+    if verbose:
+        logger.debug(f"Processing {filepath}...")
     
     if fixes is None or 'all' in fixes:
         apply_all = True
@@ -642,48 +1043,64 @@ def fix_markdown_file(filepath, config, dry_run=False, fixes=None):
         apply_all = False
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+        original_content = _read_markdown(filepath)
         
         # Apply fixes
-        content = original_content
-        
-        if apply_all or 'whitespace' in fixes:
-            content = fix_trailing_whitespace(content)
-            
-        if apply_all or 'code-blocks' in fixes:
-            content = fix_fenced_code_blocks(content)
-            
-        if apply_all or 'lists' in fixes:
-            content = fix_ordered_list_prefixes(content)
-            content = fix_list_indent_consistency(
-                content, config.get('list_indent', 2))
-            
-        if apply_all or 'headings' in fixes:
-            content = fix_heading_style(
-                content, config.get('heading_style', 'atx'))
-            
-        if apply_all or 'blank-lines' in fixes:
-            content = fix_blank_lines(content)
-            
-        if apply_all or 'line-length' in fixes:
-            content = fix_line_length(content, config.get('line_length', 120))
+        content = fix_all(original_content, config,
+                          None if apply_all else fixes)
         
         # Check if content changed
         if content != original_content:
             if not dry_run:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                _write_atomic(filepath, content)
                 logger.info(f"Fixed {filepath}")
             else:
                 logger.info(f"[DRY RUN] Would fix {filepath}")
             return True
         else:
-            logger.info(f"No changes needed for {filepath}")
+            if verbose:
+                logger.debug(f"No changes needed for {filepath}")
             return False
     except Exception as e:
         logger.error(f"Error processing {filepath}: {str(e)}")
-        return False
+        return None
+
+
+def _walk_markdown_files(directory):
+    """
+    Recursively find .md files below a directory using os.scandir.
+    
+    Yields the same paths, in the same order, as
+    Path(directory).glob('**/*.md') filtered to regular files.
+    
+    Args:
+        directory (str): Normalized base directory to search in
+        
+    Yields:
+        str: Path of each markdown file
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirs = []
+    for entry in entries:
+        # Match Path.glob: a bare '.' base gives relative paths
+        path = (entry.name if directory == '.'
+                else os.path.join(directory, entry.name))
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(path)
+            elif (os.path.normcase(entry.name).endswith('.md') and
+                    entry.is_file()):
+                yield path
+        except OSError:
+            continue
+    
+    for path in subdirs:
+        yield from _walk_markdown_files(path)
 
 
 def find_markdown_files(directory, patterns=None):
@@ -705,6 +1122,10 @@ def find_markdown_files(directory, patterns=None):
     
     try:
         for pattern in patterns:
+            if pattern == '**/*.md':
+                # Common case: skip building a Path for every entry
+                matched_files.extend(_walk_markdown_files(str(base_path)))
+                continue
             for file_path in base_path.glob(pattern):
                 if file_path.is_file():
                     matched_files.append(str(file_path))
@@ -714,6 +1135,118 @@ def find_markdown_files(directory, patterns=None):
     return matched_files
 
 
+def _file_signature(filepath):
+    """
+    Identify the current version of a file by its modification time and size.
+    
+    Args:
+        filepath (str): Path to the file
+        
+    Returns:
+        list: [mtime in nanoseconds, size in bytes], or None if the file
+            can't be read
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _fixer_version():
+    """
+    Fingerprint the fixer logic by hashing this script's source.
+    
+    Returns:
+        str: Hex digest that changes whenever the script does
+    """
+    with open(__file__, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _load_fix_cache(cache_path, settings):
+    """
+    Load the files a previous run found needed no fixes.
+    
+    The record only holds for the settings it was made with, so it is
+    ignored when the script, the configuration or the selected fixes
+    differ.
+    
+    Args:
+        cache_path (str): Path to the cache file
+        settings (str): Fingerprint of the fixer version, configuration
+            and fixes
+        
+    Returns:
+        dict: File signatures keyed by absolute path
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache {cache_path}: {str(e)}")
+        return {}
+    
+    if not isinstance(cache, dict) or cache.get('settings') != settings:
+        return {}
+    return cache.get('files', {})
+
+
+def _save_fix_cache(cache_path, settings, files):
+    """
+    Save the files known to need no fixes for the next run.
+    
+    Args:
+        cache_path (str): Path to the cache file
+        settings (str): Fingerprint of the fixer version, configuration
+            and fixes
+        files (dict): File signatures keyed by absolute path
+    """
+    try:
+        _write_atomic(
+            cache_path, json.dumps({'settings': settings, 'files': files}))
+    except OSError as e:
+        logger.warning(f"Could not write cache {cache_path}: {str(e)}")
+
+
+def _fix_markdown_task(filepath, config, dry_run, fixes):
+    """
+    Fix one file in a worker process, reporting which file it was.
+    
+    Args:
+        filepath (str): Path to the markdown file to fix
+        config (dict): Configuration settings from markdownlint
+        dry_run (bool): If True, don't write changes to the file
+        fixes (list): List of fixes to apply, or None for all fixes
+        
+    Returns:
+        tuple: The filepath and the result of fix_markdown_file
+    """
+    return filepath, fix_markdown_file(filepath, config, dry_run, fixes)
+
+
+def _positive_int(value):
+    """
+    Parse a command line value that must be a whole number of at least 1.
+    
+    Args:
+        value (str): The raw argument
+        
+    Returns:
+        int: The parsed number
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"must be a whole number of at least 1, got {value!r}")
+    return number
+
+
 def parse_arguments():
     """
     Parse command line arguments.
@@ -773,6 +1306,20 @@ def parse_arguments():
         help='Process files in parallel for better performance'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=_positive_int,
+        help='Number of worker processes; implies --parallel '
+             '(default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help=f'Skip files unchanged since a run found them clean '
+             f'(recorded in {_CACHE_FILE})'
+    )
+    
     parser.add_argument(
         '--fix',
         nargs='+',
@@ -839,29 +1386,73 @@ def main():
     
     # Process files
     fixed_count = 0
+    pending = files_to_process
     
-    if args.parallel and len(files_to_process) > 1:
-        # Process files in parallel
-        with ProcessPoolExecutor() as executor:
-            futures = [
-                executor.submit(
-                    fix_markdown_file, 
-                    file_path, 
-                    config, 
-                    args.dry_run,
-                    args.fix
-                )
-                for file_path in files_to_process
-            ]
-            
-            for future in futures:
-                if future.result():
-                    fixed_count += 1
+    cache = None
+    if args.cache:
+        # Leave out files that haven't changed since a run with the same
+        # settings found them clean
+        settings = json.dumps(
+            {'version': _fixer_version(), 'config': config,
+             'fixes': sorted(args.fix)}, sort_keys=True)
+        cache = _load_fix_cache(_CACHE_FILE, settings)
+        cached = dict(cache)
+        signatures = {path: _file_signature(path) for path in pending}
+        pending = [
+            path for path in pending
+            if signatures[path] is None or
+            cache.get(os.path.abspath(path)) != signatures[path]
+        ]
+        skipped = len(files_to_process) - len(pending)
+        if skipped:
+            logger.info(f"Skipping {skipped} files unchanged since last run")
+    
+    if (args.parallel or args.workers) and len(pending) > 1:
+        # Process files in parallel, handing them to the workers in chunks
+        # so small files don't pay a round trip each
+        if args.workers is not None:
+            workers = args.workers
+        else:
+            workers = os.cpu_count() or 1
+        chunksize = max(1, len(pending) // (workers * 4))
+        worker = functools.partial(
+            _fix_markdown_task,
+            config=config,
+            dry_run=args.dry_run,
+            fixes=args.fix
+        )
+        
+        # Imported here: it is only needed for parallel runs and costs
+        # about a fifth of this module's import time
+        import multiprocessing
+        
+        with multiprocessing.Pool(processes=workers) as pool:
+            results = list(pool.imap_unordered(
+                worker, pending, chunksize=chunksize))
     else:
         # Process files sequentially
-        for file_path in files_to_process:
-            if fix_markdown_file(file_path, config, args.dry_run, args.fix):
-                fixed_count += 1
+        results = [
+            (file_path,
+             fix_markdown_file(file_path, config, args.dry_run, args.fix))
+            for file_path in pending
+        ]
+    
+    for file_path, changed in results:
+        if changed:
+            fixed_count += 1
+        if cache is not None:
+            key = os.path.abspath(file_path)
+            # Record the version that was checked; if the file was
+            # edited meanwhile its signature no longer matches
+            if changed is False and signatures[file_path] is not None:
+                cache[key] = signatures[file_path]
+            else:
+                cache.pop(key, None)
+    
+    # Like the markdown files, the cache is only written when it changed,
+    # and a dry run writes nothing at all
+    if cache is not None and cache != cached and not args.dry_run:
+        _save_fix_cache(_CACHE_FILE, settings, cache)
     
     if args.dry_run:
         logger.info(